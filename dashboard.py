@@ -5,6 +5,7 @@
 #     "polars>=1.0.0",
 #     "requests>=2.28.0",
 #     "anywidget>=0.9.0",
+#     "orjson>=3.9.0",
 # ]
 # ///
 
@@ -1,10 +1,13 @@
 """CLI entry point: ``python -m tennis_app``."""
 
 import argparse
-import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
+
+from tennis_app.cache import load_http_cache, load_prev_rows, save_http_cache
 from tennis_app.config import CACHE_STATE_PATH
 from tennis_app.fetch import fetch_all_activities
 from tennis_app.pipeline import run
@@ -36,11 +39,12 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
+    prev_df = None
 
     if args.fixtures:
         logging.info("Loading records from fixture file: %s", args.fixtures)
-        with open(args.fixtures, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(args.fixtures, "rb") as f:
+            data = orjson.loads(f.read())
 
         # Support both {"data": [...]} (raw API response) and plain [...]
         if isinstance(data, dict) and "data" in data:
@@ -52,9 +56,16 @@ def main(argv: list[str] | None = None) -> int:
             return 1
     else:
         logging.info("Fetching activities from Better Admin API…")
-        raw_records = fetch_all_activities()
+        # Unchanged responses are revalidated (HTTP 304) instead of re-downloaded
+        http_cache = load_http_cache(args.cache)
+        # Read the cache on a worker thread while the API requests are in flight
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            prev_future = ex.submit(load_prev_rows, args.cache)
+            raw_records = fetch_all_activities(http_cache=http_cache)
+            prev_df = prev_future.result()
+        save_http_cache(args.cache, http_cache)
 
-    run(raw_records, cache_path=args.cache, notify=not args.no_notify)
+    run(raw_records, cache_path=args.cache, prev_df=prev_df, notify=not args.no_notify)
     return 0
 
 
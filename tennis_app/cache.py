@@ -2,7 +2,9 @@
 
 import logging
 import os
+from typing import Any
 
+import orjson
 import polars as pl
 
 EXPECTED_SCHEMA = {
@@ -27,22 +29,21 @@ def load_prev_rows(path: str) -> pl.DataFrame:
         df = pl.read_json(path)
         if df.is_empty():
             return _empty_frame()
-        # Cast columns to expected types (read_json returns strings for dates)
-        if "Date" in df.columns:
-            df = df.with_columns(pl.col("Date").str.strptime(pl.Date, "%Y-%m-%d", strict=False))
-        if "Scraped At" in df.columns:
-            df = df.with_columns(
-                pl.col("Scraped At").str.strptime(
-                    pl.Datetime("us"), "%Y-%m-%d %H:%M:%S", strict=False
-                )
-            )
-        if "Spaces" in df.columns:
-            df = df.with_columns(pl.col("Spaces").cast(pl.Int64, strict=False))
+        # Cast columns to expected types (read_json returns strings for dates),
+        # with explicit formats so no format inference runs
+        casts = {
+            "Date": pl.col("Date").str.strptime(pl.Date, "%Y-%m-%d", strict=False),
+            "Scraped At": pl.col("Scraped At").str.strptime(
+                pl.Datetime("us"), "%Y-%m-%d %H:%M:%S", strict=False
+            ),
+            "Spaces": pl.col("Spaces").cast(pl.Int64, strict=False),
+        }
         # Ensure nullable string columns have the right type
         for col_name in ("Venue Size", "Age"):
             if col_name in df.columns and df.schema[col_name] == pl.Null:
-                df = df.with_columns(pl.col(col_name).cast(pl.Utf8))
-        return df
+                casts[col_name] = pl.col(col_name).cast(pl.Utf8)
+        # Apply every cast in a single pass over the frame
+        return df.with_columns(expr for name, expr in casts.items() if name in df.columns)
     except FileNotFoundError:
         logging.info("No cached state found; starting fresh.")
         return _empty_frame()
@@ -54,3 +55,59 @@ def save_rows(path: str, df: pl.DataFrame) -> None:
     tmp = path + ".tmp"
     df.write_json(tmp)
     os.replace(tmp, path)
+
+
+def _sidecar_path(path: str, ext: str) -> str:
+    """Sidecar file next to a cache file (state.json -> state<ext>)."""
+    return os.path.splitext(path)[0] + ext
+
+
+def _write_atomic(path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def load_payload_hash(path: str) -> str | None:
+    """Return the payload hash saved alongside the cache file, or None if absent."""
+    try:
+        with open(_sidecar_path(path, ".hash"), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def save_payload_hash(path: str, digest: str) -> None:
+    """Save the payload hash alongside the cache file (atomic write via temp file)."""
+    _write_atomic(_sidecar_path(path, ".hash"), digest)
+
+
+def load_last_notified(path: str) -> tuple[str, float] | None:
+    """Return (digest, unix time) of the last email sent, saved alongside the cache file."""
+    try:
+        with open(_sidecar_path(path, ".notified"), encoding="utf-8") as f:
+            digest, sent_at = f.read().split()
+        return digest, float(sent_at)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def save_last_notified(path: str, digest: str, sent_at: float) -> None:
+    """Record the digest and unix time of the email just sent (atomic write via temp file)."""
+    _write_atomic(_sidecar_path(path, ".notified"), f"{digest} {sent_at}")
+
+
+def load_http_cache(path: str) -> dict[str, dict[str, Any]]:
+    """Load the cached API responses (with their ETag / Last-Modified) saved alongside the cache file."""
+    try:
+        with open(_sidecar_path(path, ".http.json"), "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+
+def save_http_cache(path: str, responses: dict[str, dict[str, Any]]) -> None:
+    """Save the cached API responses alongside the cache file (atomic write via temp file)."""
+    _write_atomic(_sidecar_path(path, ".http.json"), orjson.dumps(responses).decode("utf-8"))
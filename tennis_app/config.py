@@ -10,6 +10,9 @@ EMAIL_FROM = os.getenv("EMAIL_FROM", "")  # authorized Gmail address
 EMAIL_TO = os.getenv("EMAIL_TO", "")
 APP_PASSWORD = os.getenv("APP_PASSWORD", "")  # Gmail app password
 
+# Suppress an identical notification if one was sent within this many minutes
+NOTIFY_DEDUP_MINUTES = int(os.getenv("NOTIFY_DEDUP_MINUTES", "30"))
+
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL, logging.INFO),
@@ -1,15 +1,41 @@
 """Fetch activity data from the Better Admin API."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from tennis_app.config import VENUES
 
-
-def fetch_activities(venue: str, court: str, date: str) -> list[dict[str, Any]]:
+# Shared session so every request reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Sent with every request. Accept-Encoding is left to requests/urllib3, which
+# advertise gzip/deflate and add br/zstd only when a decoder for them is installed.
+HEADERS = {
+    "Origin": "https://bookings.better.org.uk",
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://bookings.better.org.uk/",
+}
+
+
+def fetch_activities(
+    venue: str,
+    court: str,
+    date: str,
+    session: requests.Session = SESSION,
+) -> list[dict[str, Any]]:
     """
     Fetch activity data from the Better Admin API for a specific venue, court, and date.
 
@@ -17,41 +43,71 @@ def fetch_activities(venue: str, court: str, date: str) -> list[dict[str, Any]]:
         venue: Venue identifier (e.g., "islington-tennis-centre")
         court: Court/activity identifier (e.g., "tennis-court-indoor")
         date: Date in YYYY-MM-DD format
+        session: HTTP session to send the request on (default: shared SESSION)
 
     Returns:
         List of activity records from the API "data" array
     """
+    return fetch_activities_conditional(venue, court, date, session=session)["data"]
+
+
+def fetch_activities_conditional(
+    venue: str,
+    court: str,
+    date: str,
+    cached: dict[str, Any] | None = None,
+    session: requests.Session = SESSION,
+) -> dict[str, Any]:
+    """
+    Like fetch_activities(), but revalidates a previously cached response.
+
+    If ``cached`` holds an ETag / Last-Modified from an earlier response, they are
+    sent as If-None-Match / If-Modified-Since; a 304 reply reuses the cached data
+    without transferring or parsing a body.
+
+    Returns:
+        Dict with "etag", "last_modified" (either may be None) and "data" keys
+    """
     url = f"https://better-admin.org.uk/api/activities/venue/{venue}/activity/{court}/times"
-    headers = {
-        "Origin": "https://bookings.better.org.uk",
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Referer": "https://bookings.better.org.uk/",
-    }
+    headers = dict(HEADERS)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
     params = {"date": date}
 
-    r = requests.get(url, headers=headers, params=params, timeout=15)
+    r = session.get(url, headers=headers, params=params, timeout=15)
+    if r.status_code == 304 and cached:
+        return cached
     r.raise_for_status()
-    response_data = r.json()
+    response_data = orjson.loads(r.content)
 
-    return response_data.get("data", [])
+    return {
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "data": response_data.get("data", []),
+    }
 
 
 def fetch_all_activities(
     venues: list[dict[str, str]] | None = None,
     days_ahead: int = 5,
+    max_workers: int = 10,
+    http_cache: dict[str, dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Fetch activities for all venue/court combinations for the next N days.
 
+    Requests are issued concurrently on the shared SESSION.
+
     Args:
         venues: List of venue/court dicts. Defaults to VENUES from config.
         days_ahead: Number of days ahead to fetch (default 5).
+        max_workers: Maximum number of concurrent requests (default 10).
+        http_cache: Optional cache of earlier responses, keyed by "venue/court/date",
+            used for conditional requests. Updated in place with this run's
+            responses (only those the server sent validators for).
 
     Returns:
         List of raw activity dicts, each enriched with "venue" and "court" keys.
@@ -62,31 +118,44 @@ def fetch_all_activities(
     today = datetime.now().date()
     dates = [(today + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days_ahead)]
 
+    tasks = [(vc["venue"], vc["court"], date) for vc in venues for date in dates]
+
+    prev_responses = dict(http_cache) if http_cache is not None else {}
+
+    def _fetch(task: tuple[str, str, str]) -> dict[str, Any] | Exception:
+        venue, court, date = task
+        try:
+            logging.info("Fetching %s/%s for %s...", venue, court, date)
+            cached = prev_responses.get(f"{venue}/{court}/{date}")
+            return fetch_activities_conditional(venue, court, date, cached, session=SESSION)
+        except Exception as e:
+            return e
+
     all_records: list[dict[str, Any]] = []
     fetch_errors: list[str] = []
 
-    for venue_court in venues:
-        venue = venue_court["venue"]
-        court = venue_court["court"]
-
-        for date in dates:
-            try:
-                logging.info("Fetching %s/%s for %s...", venue, court, date)
-                activities = fetch_activities(venue, court, date)
-
-                for activity in activities:
-                    if not isinstance(activity, dict):
-                        continue
-                    activity["venue"] = venue
-                    activity["court"] = court
-                    all_records.append(activity)
-
-            except Exception as e:
-                logging.warning("Failed to fetch %s/%s for %s: %s", venue, court, date, e)
-                fetch_errors.append(f"{venue}/{court} for {date}: {e}")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks)))) as ex:
+        results = list(ex.map(_fetch, tasks))
+
+    if http_cache is not None:
+        http_cache.clear()
+
+    for (venue, court, date), result in zip(tasks, results, strict=True):
+        if isinstance(result, Exception):
+            logging.warning("Failed to fetch %s/%s for %s: %s", venue, court, date, result)
+            fetch_errors.append(f"{venue}/{court} for {date}: {result}")
+            continue
+
+        if http_cache is not None and (result["etag"] or result["last_modified"]):
+            http_cache[f"{venue}/{court}/{date}"] = result
+
+        for activity in result["data"]:
+            if not isinstance(activity, dict):
                 continue
+            # Copy so the cached response data stays as the API returned it
+            all_records.append({**activity, "venue": venue, "court": court})
 
-    total_attempts = len(venues) * len(dates)
+    total_attempts = len(tasks)
 
     if fetch_errors and not all_records:
         raise RuntimeError(
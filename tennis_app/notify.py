@@ -4,13 +4,16 @@ import html
 import logging
 
 import polars as pl
-from redmail import gmail
 
 from tennis_app.config import APP_PASSWORD, EMAIL_FROM, EMAIL_TO
 
 
 def configure_gmail() -> None:
     """Set Gmail credentials on the module-level client (idempotent)."""
+    # Imported here, not at module level: Red-Mail is only needed when an email
+    # is actually sent, and most runs never get that far
+    from redmail import gmail
+
     if EMAIL_FROM and APP_PASSWORD:
         gmail.username = EMAIL_FROM
         gmail.password = APP_PASSWORD
@@ -18,22 +21,16 @@ def configure_gmail() -> None:
 
 def _dataframe_to_html(df: pl.DataFrame) -> str:
     """Render a Polars DataFrame as an HTML table string (no pyarrow needed)."""
-    rows = df.to_dicts()
-    cols = df.columns
-
     parts = ['<table border="1" cellpadding="4" cellspacing="0">']
     parts.append("<thead><tr>")
-    for c in cols:
+    for c in df.columns:
         parts.append(f"<th>{html.escape(c)}</th>")
     parts.append("</tr></thead><tbody>")
 
-    for row in rows:
-        parts.append("<tr>")
-        for c in cols:
-            val = row[c]
-            cell = html.escape(str(val)) if val is not None else ""
-            parts.append(f"<td>{cell}</td>")
-        parts.append("</tr>")
+    # Row tuples avoid building a dict per row just to look the cells up again
+    for row in df.iter_rows():
+        cells = (html.escape(str(val)) if val is not None else "" for val in row)
+        parts.append("<tr>" + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>")
 
     parts.append("</tbody></table>")
     return "\n".join(parts)
@@ -57,6 +54,7 @@ def send_email(subject: str, changed_rows: pl.DataFrame) -> None:
         raise ValueError("changed_rows cannot be empty")
 
     configure_gmail()
+    from redmail import gmail
 
     display_columns = ["Date", "Time", "Venue", "Spaces", "Venue Size", "URL"]
     table_html = _dataframe_to_html(changed_rows.select(display_columns))
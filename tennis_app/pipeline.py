@@ -1,56 +1,96 @@
 """Pipeline: the main orchestration that takes raw records and runs the business logic."""
 
+import hashlib
 import logging
+import os
+import time
 from typing import Any
 
+import orjson
 import polars as pl
 
-from tennis_app.cache import load_prev_rows, save_rows
+from tennis_app.cache import (
+    load_last_notified,
+    load_payload_hash,
+    load_prev_rows,
+    save_last_notified,
+    save_payload_hash,
+    save_rows,
+)
+from tennis_app.config import NOTIFY_DEDUP_MINUTES
 from tennis_app.notify import send_email
-from tennis_app.transform import diff_tables, key_of, tabularise
+from tennis_app.transform import diff_tables, tabularise
+
+
+def _payload_hash(raw_records: list[dict[str, Any]]) -> str:
+    """SHA-256 of the raw records in a canonical JSON encoding."""
+    return hashlib.sha256(orjson.dumps(raw_records, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _recently_notified(cache_path: str, digest: str) -> bool:
+    """True if an email for the same changed keys went out within NOTIFY_DEDUP_MINUTES."""
+    last = load_last_notified(cache_path)
+    if last is None:
+        return False
+    last_digest, sent_at = last
+    return last_digest == digest and time.time() - sent_at < NOTIFY_DEDUP_MINUTES * 60
 
 
 def run(
     raw_records: list[dict[str, Any]],
     cache_path: str,
     *,
+    prev_df: pl.DataFrame | None = None,
     notify: bool = True,
 ) -> pl.DataFrame:
     """
     Execute the full pipeline:
+      0. Skip everything if the raw records are identical to the last run
       1. Transform raw API records into a clean table
-      2. Load the previously-cached table
+      2. Load the previously-cached table (unless already provided)
       3. Diff the two
-      4. Optionally send an email for any changes
-      5. Save the current table to cache
+      4. Optionally send an email for any changes (unless the same email was just sent)
+      5. Save the current table to cache (if anything changed)
 
     Args:
         raw_records: List of activity dicts (from the API or from fixtures).
         cache_path: Path to the JSON cache file.
+        prev_df: Previously-cached table, if the caller has already loaded it.
         notify: If True (default), send email on changes. Set False for testing.
 
     Returns:
         The current transformed DataFrame.
     """
+    payload_hash = _payload_hash(raw_records)
+    if payload_hash == load_payload_hash(cache_path) and os.path.exists(cache_path):
+        logging.info("Raw records unchanged since last run; skipping diff.")
+        return prev_df if prev_df is not None else load_prev_rows(cache_path)
+
     logging.info("Tabularising %d raw records…", len(raw_records))
     curr_df = tabularise(raw_records)
 
-    logging.info("Loading previous rows from cache…")
-    prev_df = load_prev_rows(cache_path)
+    if prev_df is None:
+        logging.info("Loading previous rows from cache…")
+        prev_df = load_prev_rows(cache_path)
 
     logging.info("Computing changes…")
-    changed_keys = diff_tables(curr_df, prev_df)
+    changed_keys, changed_indices = diff_tables(curr_df, prev_df)
 
     if changed_keys:
-        curr_map = {key_of(row): i for i, row in enumerate(curr_df.to_dicts())}
-        changed_indices = [curr_map[k] for k in changed_keys if k in curr_map]
-
         if changed_indices:
             changed_df = curr_df[changed_indices]
 
             if notify:
-                logging.info("Sending email with %d changed keys…", len(changed_keys))
-                send_email("Tennis availability changes", changed_df)
+                # Flapping slots produce the same set of keys run after run
+                digest = hashlib.sha256("\n".join(sorted(changed_keys)).encode()).hexdigest()
+                if _recently_notified(cache_path, digest):
+                    logging.info(
+                        "Suppressed duplicate email for %d changed keys.", len(changed_keys)
+                    )
+                else:
+                    logging.info("Sending email with %d changed keys…", len(changed_keys))
+                    send_email("Tennis availability changes", changed_df)
+                    save_last_notified(cache_path, digest, time.time())
             else:
                 logging.info("Changes detected (%d) but notifications disabled.", len(changed_keys))
         else:
@@ -58,6 +98,11 @@ def run(
     else:
         logging.info("No changes detected; no email.")
 
-    logging.info("Saving current rows back to cache…")
-    save_rows(cache_path, curr_df)
+    # With no changes the cached rows already match the current ones
+    if changed_keys or not os.path.exists(cache_path):
+        logging.info("Saving current rows back to cache…")
+        save_rows(cache_path, curr_df)
+    else:
+        logging.info("Cache already up to date; not rewriting it.")
+    save_payload_hash(cache_path, payload_hash)
     return curr_df
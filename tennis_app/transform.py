@@ -1,17 +1,27 @@
 """Transform raw API records into a clean Polars DataFrame and diff tables."""
 
-from datetime import UTC, datetime
-
 import polars as pl
 
+# Subset of the raw API record that tabularise() reads; other fields are ignored
+RAW_SCHEMA: dict[str, pl.DataType] = {
+    "starts_at": pl.Struct({"format_12_hour": pl.Utf8, "format_24_hour": pl.Utf8}),
+    "ends_at": pl.Struct({"format_24_hour": pl.Utf8}),
+    "date": pl.Utf8(),
+    "spaces": pl.Int64(),
+    "location": pl.Utf8(),
+    "timestamp": pl.Int64(),
+    "venue": pl.Utf8(),
+    "court": pl.Utf8(),
+}
+
 
 def tabularise(raw_records: list[dict]) -> pl.DataFrame:
     """
     Transform raw API activity records into a normalised Polars DataFrame.
 
     Accepts the list of dicts returned by fetch_all_activities() (or loaded
-    from a fixture file).  Each dict has nested objects for starts_at,
-    ends_at, and price which are flattened here.
+    from a fixture file).  Each dict has nested objects for starts_at and
+    ends_at which are read as struct columns and flattened here.
 
     Returns a DataFrame with columns:
         Time, Date, Spaces, Venue, Venue Size, Age, Scraped At, URL
@@ -31,60 +41,44 @@ def tabularise(raw_records: list[dict]) -> pl.DataFrame:
     if not raw_records:
         return empty
 
-    # Flatten nested dicts before creating the DataFrame
-    flat: list[dict] = []
-    for rec in raw_records:
-        starts_at = rec.get("starts_at") or {}
-        ends_at = rec.get("ends_at") or {}
-        flat.append(
-            {
-                "time_12h": starts_at.get("format_12_hour"),
-                "time_24h": starts_at.get("format_24_hour"),
-                "end_24h": ends_at.get("format_24_hour"),
-                "date": rec.get("date"),
-                "spaces": rec.get("spaces"),
-                "location": rec.get("location"),
-                "timestamp": rec.get("timestamp"),
-                "venue": rec.get("venue"),
-                "court": rec.get("court"),
-            }
-        )
+    # Load only the fields we need; nested objects arrive as structs
+    df = pl.DataFrame(raw_records, schema=RAW_SCHEMA, strict=False)
 
-    df = pl.DataFrame(flat)
+    starts_at = pl.col("starts_at").struct
+    ends_at = pl.col("ends_at").struct
 
     result = df.select(
-        pl.col("time_12h").alias("Time"),
+        starts_at.field("format_12_hour").alias("Time"),
         pl.col("date").str.strptime(pl.Date, "%Y-%m-%d", strict=False).alias("Date"),
-        pl.col("spaces").cast(pl.Int64).alias("Spaces"),
+        pl.col("spaces").alias("Spaces"),
         pl.col("location").alias("Venue"),
         pl.lit(None).cast(pl.Utf8).alias("Venue Size"),
         pl.lit(None).cast(pl.Utf8).alias("Age"),
-        pl.col("timestamp")
-        .cast(pl.Int64)
-        .map_elements(
-            lambda ts: datetime.fromtimestamp(ts, tz=UTC) if ts is not None else None,
-            return_dtype=pl.Datetime("us", "UTC"),
-        )
-        .cast(pl.Datetime("us"))
-        .alias("Scraped At"),
-        # Construct booking URL
-        (
-            pl.lit("https://bookings.better.org.uk/location/")
-            + pl.col("venue")
-            + pl.lit("/")
-            + pl.col("court")
-            + pl.lit("/")
-            + pl.col("date")
-            + pl.lit("/by-time/slot/")
-            + pl.col("time_24h")
-            + pl.lit("-")
-            + pl.col("end_24h")
+        # Epoch seconds -> naive UTC datetime, without a per-row Python call
+        pl.from_epoch("timestamp", time_unit="s").alias("Scraped At"),
+        # Construct booking URL in a single pass; null if any part is missing
+        pl.concat_str(
+            [
+                pl.lit("https://bookings.better.org.uk/location/"),
+                pl.col("venue"),
+                pl.lit("/"),
+                pl.col("court"),
+                pl.lit("/"),
+                pl.col("date"),
+                pl.lit("/by-time/slot/"),
+                starts_at.field("format_24_hour"),
+                pl.lit("-"),
+                ends_at.field("format_24_hour"),
+            ]
         ).alias("URL"),
     )
 
     return result
 
 
+KEY_COLUMNS = ["Date", "Time", "Venue"]
+
+
 def key_of(row: dict) -> str:
     """Generate a unique key for a row dict based on Date|Time|Venue."""
     date_str = str(row.get("Date", ""))
@@ -93,26 +87,75 @@ def key_of(row: dict) -> str:
     return f"{date_str}|{time_str}|{venue_str}"
 
 
-def diff_tables(curr: pl.DataFrame, prev: pl.DataFrame) -> list[str]:
+def key_expr() -> pl.Expr:
+    """Vectorised equivalent of key_of() for use in DataFrame expressions."""
+    return pl.concat_str(
+        [pl.col(c).cast(pl.Utf8).fill_null("None") for c in KEY_COLUMNS],
+        separator="|",
+    )
+
+
+def _row_digests(df: pl.DataFrame, columns: list[str]) -> pl.LazyFrame:
+    """Return one (_k, _h, _i) row per key: _h hashes the row's values, _i is its position."""
+    # Like a key -> row dict, the last row wins when a key is duplicated
+    return (
+        df.lazy()
+        .select(
+            key_expr().alias("_k"),
+            pl.struct(columns).hash().alias("_h"),
+            pl.int_range(pl.len()).alias("_i"),
+        )
+        .unique("_k", keep="last")
+    )
+
+
+def _last_row_indices(df: pl.DataFrame) -> list[int]:
+    """Positions of the last row for each key, in key order."""
+    return (
+        df.lazy()
+        .select(key_expr().alias("_k"), pl.int_range(pl.len()).alias("_i"))
+        .unique("_k", keep="last")
+        .sort("_k")
+        .collect()
+        .get_column("_i")
+        .to_list()
+    )
+
+
+def diff_tables(curr: pl.DataFrame, prev: pl.DataFrame) -> tuple[list[str], list[int]]:
     """
     Compare two DataFrames and return keys of rows that changed.
 
     "Changed" means any field difference, or added/removed rows.
+
+    Returns:
+        (changed_keys, changed_indices): the keys of changed rows, and the
+        positions in ``curr`` of the rows to report for them (the last row per
+        key, in key order; removed keys have no current row).
     """
     if prev.is_empty():
-        return [key_of(row) for row in curr.to_dicts()] if not curr.is_empty() else []
+        return curr.select(key_expr()).to_series().to_list(), _last_row_indices(curr)
 
     if curr.is_empty():
-        return [key_of(row) for row in prev.to_dicts()]
-
-    prev_map = {key_of(row): row for row in prev.to_dicts()}
-    curr_map = {key_of(row): row for row in curr.to_dicts()}
-
-    changed_keys: list[str] = []
-    all_keys = sorted(set(prev_map.keys()) | set(curr_map.keys()))
-    for k in all_keys:
-        a, b = prev_map.get(k), curr_map.get(k)
-        if a is None or b is None or a != b:
-            changed_keys.append(k)
-
-    return changed_keys
+        return prev.select(key_expr()).to_series().to_list(), []
+
+    # Fast path: identical tables (same rows in the same order) have no changes
+    if curr.equals(prev):
+        return [], []
+
+    if set(curr.columns) != set(prev.columns):
+        # Rows with different fields can never compare equal
+        all_keys = pl.concat([curr.select(key_expr()), prev.select(key_expr())]).to_series()
+        return all_keys.unique().sort().to_list(), _last_row_indices(curr)
+
+    # Compare a single digest per key instead of every column pair; the lazy
+    # query runs hashing, join and filter as one plan without intermediate frames
+    columns = sorted(curr.columns)
+    joined = _row_digests(curr, columns).join(
+        _row_digests(prev, columns), on="_k", how="full", suffix="_prev"
+    )
+    changed = (
+        pl.col("_k").is_null() | pl.col("_k_prev").is_null() | (pl.col("_h") != pl.col("_h_prev"))
+    )
+    result = joined.filter(changed).select(pl.coalesce("_k", "_k_prev"), "_i").sort("_k").collect()
+    return result.get_column("_k").to_list(), result.get_column("_i").drop_nulls().to_list()